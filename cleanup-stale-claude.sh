@@ -25,7 +25,10 @@ notify() {
         return
     fi
     if command -v osascript >/dev/null 2>&1; then
-        /usr/bin/osascript -e "display notification \"${msg//\"/\\\"}\" with title \"${NOTIFY_TITLE}\"" >/dev/null 2>&1 || true
+        # Pass text as argv so it never has to be quoted into AppleScript source
+        /usr/bin/osascript -e 'on run argv' \
+            -e 'display notification (item 1 of argv) with title (item 2 of argv)' \
+            -e 'end run' "$msg" "$NOTIFY_TITLE" >/dev/null 2>&1 || true
     fi
 }
 
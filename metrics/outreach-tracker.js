@@ -24,17 +24,19 @@ const WEEKLY_TARGET = 10;
 // Initialize outreach log if doesn't exist
 function initOutreachLog() {
   if (!fs.existsSync(OUTREACH_LOG)) {
-    fs.writeFileSync(OUTREACH_LOG, JSON.stringify({
-      outreaches: [],
-      responses: [],
-      interviews: []
-    }, null, 2));
+    const log = { outreaches: [], responses: [], interviews: [] };
+    saveOutreachLog(log);
+    return log;
   }
   return JSON.parse(fs.readFileSync(OUTREACH_LOG, 'utf8'));
 }
 
+// Write to a per-process temp file and rename so concurrent readers and
+// writers (voice logging, dashboard) never see a half-written log
 function saveOutreachLog(data) {
-  fs.writeFileSync(OUTREACH_LOG, JSON.stringify(data, null, 2));
+  const tmp = `${OUTREACH_LOG}.${process.pid}.tmp`;
+  fs.writeFileSync(tmp, JSON.stringify(data, null, 2));
+  fs.renameSync(tmp, OUTREACH_LOG);
 }
 
 function getWeekStart() {
@@ -35,30 +35,60 @@ const CATEGORY_PATTERNS = {
 function getThingsLogbook(periodWeeks) {
   try {
     const daysBack = periodWeeks * 7;
+    // Pull each property for the whole logbook in one Apple event, then
+    // format locally into a list (string & in a loop is quadratic).
+    // The reference re-runs its whose filter on every get, so the ids are
+    // read before and after; if they differ the logbook changed mid-read
+    // and the property lists may not line up, so read again. If the bulk
+    // gets fail (or never settle), fall back to reading item by item.
     const script = `
 tell application "Things3"
   set cutoffDate to (current date) - ${daysBack} * days
-  set logbookItems to to dos of list "Logbook" whose completion date > cutoffDate
-  set output to ""
-  repeat with t in logbookItems
-    set taskName to name of t
-    set compDate to completion date of t
-    set taskTags to ""
+  set logbookItems to a reference to (to dos of list "Logbook" whose completion date > cutoffDate)
+  set bulkOK to false
+  repeat 3 times
     try
-      set tagList to tags of t
-      repeat with tg in tagList
-        set taskTags to taskTags & (name of tg) & ","
-      end repeat
+      set idsBefore to id of logbookItems
+      set taskNames to name of logbookItems
+      set compDates to completion date of logbookItems
+      set taskTags to tag names of logbookItems
+      set taskNotes to notes of logbookItems
+      set idsAfter to id of logbookItems
+    on error
+      exit repeat
     end try
-    set taskNotes to ""
-    try
-      set taskNotes to notes of t
-    end try
-    set output to output & taskName & "|" & (compDate as string) & "|" & taskTags & "|" & taskNotes & "
-"
+    if idsBefore = idsAfter then
+      set bulkOK to true
+      exit repeat
+    end if
   end repeat
-  return output
+  if not bulkOK then
+    set taskNames to {}
+    set compDates to {}
+    set taskTags to {}
+    set taskNotes to {}
+    repeat with t in (to dos of list "Logbook" whose completion date > cutoffDate)
+      set end of taskNames to name of t
+      set end of compDates to completion date of t
+      set tagText to ""
+      try
+        set tagText to tag names of t
+      end try
+      set end of taskTags to tagText
+      set noteText to ""
+      try
+        set noteText to notes of t
+      end try
+      set end of taskNotes to noteText
+    end repeat
+  end if
 end tell
+set output to {}
+repeat with i from 1 to count of taskNames
+  set end of output to (item i of taskNames) & "|" & ((item i of compDates) as string) & "|" & (item i of taskTags) & "|" & (item i of taskNotes)
+end repeat
+set AppleScript's text item delimiters to linefeed
+return output as text
 `;
 
     const result = execFileSync('osascript', ['-e', script], {
@@ -72,7 +102,7 @@ end tell
       return {
         name: name || '',
         date: dateStr || '',
-        tags: tags?.split(',').filter(t => t) || [],
+        tags: tags?.split(',').map(t => t.trim()).filter(t => t) || [],
         notes: notes || ''
       };
     });